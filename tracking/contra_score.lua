@@ -11,6 +11,80 @@ local PLAYER1_GAME_OVER_ADDR = 0x0038   -- P1 Game Over Status (0x00 not game ov
 local PLAYER1_SCORE_ADDR_LOW = 0x07E2   -- Low byte (little-endian)
 local PLAYER1_SCORE_ADDR_HIGH = 0x07E3  -- High byte (little-endian)
 
+-- Game Genie cheat addresses and their activated values
+local GENIE_CHEATS = {
+    -- Lives cheats
+    {addr = 0xDA03, value = 0xB5, name = "Infinite Lives"},
+    {addr = 0xDA03, value = 0xA5, name = "Infinite Lives (Alt)"},
+    {addr = 0xDA03, value = 0xF7, name = "Extra Life on Death"},
+    {addr = 0xC468, value = 0x63, name = "30 Lives"},
+
+    {addr = 0xC462, value = 0x1D, name = "P1+P2 30 Lives"},
+    {addr = 0xC462, value = 0x9E, name = "175 Lives"},
+    
+    -- Weapon cheats
+    {addr = 0xDAD3, value = 0x2C, name = "Keep Weapon"},
+    {addr = 0xDAD2, value = 0x01, name = "Start with Machine Gun"},
+    {addr = 0xDAD2, value = 0x02, name = "Start with Flame Thrower"},
+    {addr = 0xDAD2, value = 0x03, name = "Start with Spread Gun"},
+    {addr = 0xDAD2, value = 0x04, name = "Start with Laser"},
+    
+    -- Invincibility cheats
+    {addr = 0xD467, value = 0xB5, name = "Invincibility"},
+    {addr = 0xE2C9, value = 0xAD, name = "Alternate Invincible"},
+
+    {addr = 0xD53D, value = 0xB0, name = "Super Body"},
+    
+    -- Movement cheats
+    {addr = 0xD6E9, value = 0xFA, name = "Jump Higher"},
+    {addr = 0xD9F0, value = 0x14, name = "Jump Higher 2"},
+    {addr = 0xD476, value = 0x20, name = "Jump Mid Air 1"},
+    {addr = 0xD477, value = 0x9F, name = "Jump Mid Air 2"},
+    {addr = 0xD478, value = 0xD6, name = "Jump Mid Air 3"},
+    {addr = 0xD479, value = 0xEA, name = "Jump Mid Air 4"},
+    {addr = 0xD480, value = 0xB5, name = "Jump Mid Air 5"},
+    {addr = 0xD9E9, value = 0xB5, name = "Jump Mid Air 6"},
+    {addr = 0xD54A, value = 0x60, name = "Jump Mid Air 7"},
+    {addr = 0xD75D, value = 0x04, name = "Run 4x Faster 1"},
+    {addr = 0xD761, value = 0xFC, name = "Run 4x Faster 2"},
+
+    {addr = 0xE01D, value = 0xB5, name = "Walk on Water"},
+    
+    -- Level/Game cheats (removed 0x00 checks that cause false positives)
+    {addr = 0xC479, value = 0x30, name = "Level Select"},
+    {addr = 0xD04D, value = 0x3B, name = "Press Start to Complete Level"},
+    {addr = 0xCD5A, value = 0x30, name = "Turn Off Electric Barrier"},
+    
+    -- Combat cheats
+    {addr = 0xD063, value = 0x98, name = "Harder Boss"},
+    {addr = 0xE3F8, value = 0x94, name = "Bullets Through Enemies"},
+    {addr = 0xE358, value = 0xA9, name = "Enemies Die Auto 1"},
+    {addr = 0xE360, value = 0x42, name = "Enemies Die Auto 2"},
+
+    {addr = 0xC4A7, value = 0xAD, name = "Tons of Points"},
+    
+    -- Visual/Audio cheats
+    {addr = 0x8348, value = 0xD9, name = "Slow Weapons Capsules"},
+    {addr = 0xC7C9, value = 0x98, name = "Walk on Exploded Bridge"},
+    {addr = 0x88C4, value = 0xBD, name = "DPCM Pop Reducer 1"},
+    {addr = 0xC07E, value = 0xA9, name = "Black and White Mode 1"},
+    {addr = 0xC07F, value = 0x1F, name = "Black and White Mode 2"},
+    {addr = 0xCEE0, value = 0x14, name = "Remove Lifebar Indicators"}
+}
+
+-- GENIE_CHEATS grouped by address so each address is read once per check
+local GENIE_CHEAT_ADDRS = {}
+local genie_cheats_by_addr = {}
+for _, cheat in ipairs(GENIE_CHEATS) do
+    local entry = genie_cheats_by_addr[cheat.addr]
+    if not entry then
+        entry = {addr = cheat.addr, names = {}}
+        genie_cheats_by_addr[cheat.addr] = entry
+        table.insert(GENIE_CHEAT_ADDRS, entry)
+    end
+    entry.names[cheat.value] = cheat.name
+end
+
 -- State tracking variables
 local previous_lives = -1
 local score_captured = false
@@ -21,10 +95,13 @@ local capture_delay = 10      -- Frames to wait after game over before capturing
 local cheats_detected = false
 local awaiting_initials = false  -- Flag to indicate we're waiting for player initials
 local player_initials = ""       -- Store the entered initials
+local displayed_score = -1       -- Score last shown on screen
+local displayed_score_text = ""  -- Cached overlay text for displayed_score
 
 
 
 -- Logging
+local SEPARATOR = string.rep("=", 51)  -- Banner rule for console and log output
 local log_file = nil
 local script_start_time = os.time()
 
@@ -35,7 +112,7 @@ local function init_logging()
     log_file = io.open(filename, "w")
     if log_file then
         log_file:write(string.format("Contra Score Capture Log - Started: %s\n", os.date("%Y-%m-%d %H:%M:%S")))
-        log_file:write("=" .. string.rep("=", 50) .. "\n")
+        log_file:write(SEPARATOR .. "\n")
         log_file:flush()
         console.log("Score logging initialized: " .. filename)
     else
@@ -66,75 +143,14 @@ local function read_player1_score()
 end
 
 -- Check for Game Genie cheat codes based on specific memory addresses
-local function detect_cheats()
-    -- Game Genie cheat addresses and their activated values
-    local genie_cheats = {
-        -- Lives cheats
-        {addr = 0xDA03, value = 0xB5, name = "Infinite Lives"},
-        {addr = 0xDA03, value = 0xA5, name = "Infinite Lives (Alt)"},
-        {addr = 0xDA03, value = 0xF7, name = "Extra Life on Death"},
-        {addr = 0xC468, value = 0x63, name = "30 Lives"},
-
-        {addr = 0xC462, value = 0x1D, name = "P1+P2 30 Lives"},
-        {addr = 0xC462, value = 0x9E, name = "175 Lives"},
-        
-        -- Weapon cheats
-        {addr = 0xDAD3, value = 0x2C, name = "Keep Weapon"},
-        {addr = 0xDAD2, value = 0x01, name = "Start with Machine Gun"},
-        {addr = 0xDAD2, value = 0x02, name = "Start with Flame Thrower"},
-        {addr = 0xDAD2, value = 0x03, name = "Start with Spread Gun"},
-        {addr = 0xDAD2, value = 0x04, name = "Start with Laser"},
-        
-        -- Invincibility cheats
-        {addr = 0xD467, value = 0xB5, name = "Invincibility"},
-        {addr = 0xE2C9, value = 0xAD, name = "Alternate Invincible"},
-
-        {addr = 0xD53D, value = 0xB0, name = "Super Body"},
-        
-        -- Movement cheats
-        {addr = 0xD6E9, value = 0xFA, name = "Jump Higher"},
-        {addr = 0xD9F0, value = 0x14, name = "Jump Higher 2"},
-        {addr = 0xD476, value = 0x20, name = "Jump Mid Air 1"},
-        {addr = 0xD477, value = 0x9F, name = "Jump Mid Air 2"},
-        {addr = 0xD478, value = 0xD6, name = "Jump Mid Air 3"},
-        {addr = 0xD479, value = 0xEA, name = "Jump Mid Air 4"},
-        {addr = 0xD480, value = 0xB5, name = "Jump Mid Air 5"},
-        {addr = 0xD9E9, value = 0xB5, name = "Jump Mid Air 6"},
-        {addr = 0xD54A, value = 0x60, name = "Jump Mid Air 7"},
-        {addr = 0xD75D, value = 0x04, name = "Run 4x Faster 1"},
-        {addr = 0xD761, value = 0xFC, name = "Run 4x Faster 2"},
-
-        {addr = 0xE01D, value = 0xB5, name = "Walk on Water"},
-        
-        -- Level/Game cheats (removed 0x00 checks that cause false positives)
-        {addr = 0xC479, value = 0x30, name = "Level Select"},
-        {addr = 0xD04D, value = 0x3B, name = "Press Start to Complete Level"},
-        {addr = 0xCD5A, value = 0x30, name = "Turn Off Electric Barrier"},
-        
-        -- Combat cheats
-        {addr = 0xD063, value = 0x98, name = "Harder Boss"},
-        {addr = 0xE3F8, value = 0x94, name = "Bullets Through Enemies"},
-        {addr = 0xE358, value = 0xA9, name = "Enemies Die Auto 1"},
-        {addr = 0xE360, value = 0x42, name = "Enemies Die Auto 2"},
-
-        {addr = 0xC4A7, value = 0xAD, name = "Tons of Points"},
-        
-        -- Visual/Audio cheats
-        {addr = 0x8348, value = 0xD9, name = "Slow Weapons Capsules"},
-        {addr = 0xC7C9, value = 0x98, name = "Walk on Exploded Bridge"},
-        {addr = 0x88C4, value = 0xBD, name = "DPCM Pop Reducer 1"},
-        {addr = 0xC07E, value = 0xA9, name = "Black and White Mode 1"},
-        {addr = 0xC07F, value = 0x1F, name = "Black and White Mode 2"},
-        {addr = 0xCEE0, value = 0x14, name = "Remove Lifebar Indicators"}
-    }
-    
+local function detect_cheats(lives)
     -- Check each Game Genie cheat address
-    for i = 1, #genie_cheats do
-        local cheat = genie_cheats[i]
-        local memory_value = memory.read_u8(cheat.addr)
+    for i = 1, #GENIE_CHEAT_ADDRS do
+        local entry = GENIE_CHEAT_ADDRS[i]
+        local cheat_name = entry.names[memory.read_u8(entry.addr)]
         
-        if memory_value == cheat.value then
-            return true, cheat.name .. " Code"
+        if cheat_name then
+            return true, cheat_name .. " Code"
         end
     end
     
@@ -152,7 +168,6 @@ local function detect_cheats()
     end
     
     -- Check for obvious infinite lives value (255)
-    local lives = read_player1_lives()
     if lives == 255 then
         return true, "Infinite Lives (Memory)"
     end
@@ -164,21 +179,20 @@ end
 local function format_score(score)
     -- Add commas for thousands separators
     local formatted = tostring(score)
-    local result = ""
     local len = string.len(formatted)
     
-    for i = 1, len do
-        local digit = string.sub(formatted, i, i)
-        result = result .. digit
-        
-        -- Add comma if there are more digits and position is right for comma
-        local remaining = len - i
-        if remaining > 0 and remaining % 3 == 0 then
-            result = result .. ","
-        end
+    -- Leading group holds 1-3 digits, every group after it exactly 3
+    local first = len % 3
+    if first == 0 then
+        first = 3
+    end
+    
+    local groups = {string.sub(formatted, 1, first)}
+    for i = first + 1, len, 3 do
+        table.insert(groups, string.sub(formatted, i, i + 2))
     end
     
-    return result
+    return table.concat(groups, ",")
 end
 
 -- Prompt for player initials
@@ -209,12 +223,12 @@ local function log_score(score)
     local log_entry = string.format("[%s] Player: %s - Final Score: %s", timestamp, player_initials, formatted_score)
     
     -- Console output
-    console.log("=" .. string.rep("=", 50))
+    console.log(SEPARATOR)
     console.log("GAME OVER - SCORE CAPTURED!")
     console.log("Player: " .. player_initials)
     console.log("Final Score: " .. formatted_score)
     console.log("Time: " .. timestamp)
-    console.log("=" .. string.rep("=", 50))
+    console.log(SEPARATOR)
     
     -- File logging
     if log_file then
@@ -227,20 +241,21 @@ local function log_score(score)
 end
 
 -- Check if we're in a valid game state
-local function is_valid_game_state()
+local function is_valid_game_state(lives)
     -- Basic validation - make sure we're not in menu or other non-game states
-    local lives = read_player1_lives()
     return lives >= 0 and lives <= 10  -- Reasonable range for lives
 end
 
 -- Main monitoring function
 local function monitor_game_state()
-    if not is_valid_game_state() then
+    -- Read lives once per frame and share it with the checks below
+    local current_lives = read_player1_lives()
+    if not is_valid_game_state(current_lives) then
         return
     end
     
     -- Check for cheats first
-    local cheat_found, cheat_type = detect_cheats()
+    local cheat_found, cheat_type = detect_cheats(current_lives)
     if cheat_found and not cheats_detected then
         cheats_detected = true
         console.log("CHEATS DETECTED: " .. cheat_type .. " - Score tracking disabled")
@@ -249,7 +264,6 @@ local function monitor_game_state()
         console.log("Cheats no longer detected - Score tracking re-enabled")
     end
     
-    local current_lives = read_player1_lives()
     local current_frame = emu.framecount()
     
     -- Check if we need to reset capture state (new game started)
@@ -312,7 +326,12 @@ local function display_score_only()
         gui.text(10, 25, "in the dialog box", "white", "black")
     else
         local score = read_player1_score()
-        gui.text(10, 10, string.format("Score: %s", format_score(score)), "white", "black")
+        -- Only re-format when the score actually changes
+        if score ~= displayed_score then
+            displayed_score = score
+            displayed_score_text = string.format("Score: %s", format_score(score))
+        end
+        gui.text(10, 10, displayed_score_text, "white", "black")
     end
 end
 
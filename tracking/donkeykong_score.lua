@@ -17,6 +17,17 @@ local CHEAT_ADDRS = {
     {addr = 0x954B, value = 0x4B, name = "Keep Hammer Longer"}
 }
 
+-- Keyboard keys accepted during initial entry and the letter each one enters
+local LETTER_KEYS = {}
+for i = string.byte('A'), string.byte('Z') do
+    local letter = string.char(i)
+    table.insert(LETTER_KEYS, {key = letter, letter = letter})
+end
+for i = string.byte('a'), string.byte('z') do
+    local key = string.char(i)
+    table.insert(LETTER_KEYS, {key = key, letter = key:upper()})
+end
+
 local score_captured = false
 local entry_mode = false
 local initials = {"", "", ""}
@@ -110,23 +121,10 @@ end
 local function handle_keyboard_input()
     local keys = input.get()
     
-    -- Handle letter input (A-Z)
-    for i = string.byte('A'), string.byte('Z') do
-        local letter = string.char(i)
-        if is_key_pressed(letter, keys) then
-            initials[current_letter] = letter
-            -- Auto-advance to next position
-            if current_letter < 3 then
-                current_letter = current_letter + 1
-            end
-        end
-    end
-    
-    -- Handle lowercase letters too
-    for i = string.byte('a'), string.byte('z') do
-        local letter = string.char(i):upper()
-        if is_key_pressed(string.char(i), keys) then
-            initials[current_letter] = letter
+    -- Handle letter input (A-Z, lowercase keys enter uppercase letters)
+    for _, entry in ipairs(LETTER_KEYS) do
+        if is_key_pressed(entry.key, keys) then
+            initials[current_letter] = entry.letter
             -- Auto-advance to next position
             if current_letter < 3 then
                 current_letter = current_letter + 1
@@ -192,11 +190,8 @@ local function handle_keyboard_input()
         console.log("❌ Initial entry cancelled")
     end
     
-    -- Store current keys for next frame
-    prev_keys = {}
-    for k, v in pairs(keys) do
-        prev_keys[k] = v
-    end
+    -- Keep current keys for next frame (input.get returns a fresh table each call)
+    prev_keys = keys
 end
 
 console.clear()